@@ -0,0 +1,16 @@
+# Gunicorn settings shared by the Procfile and the Dockerfile
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+
+# One process: the bot, its positions and its event loop live in module globals,
+# so a second worker would run a second, independent bot. Threads serve
+# concurrent dashboard polls instead.
+workers = 1
+worker_class = 'gthread'
+threads = 8
+
+# Dashboard polls reuse their connection between ticks
+keepalive = 30
+timeout = 300
+preload_app = True
@@ -1,19 +1,35 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hmac
 import hashlib
+import gzip
 import time
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import orjson
+from urllib.parse import urlencode
+from datetime import datetime
+from typing import Dict, List, Tuple
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
+import atexit
+import functools
 from dataclasses import dataclass
+from collections import OrderedDict
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from flask import Flask, jsonify, request, render_template_string
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
 import threading
 
-@dataclass
+# Stablecoins are never used as cascade collateral
+STABLECOINS = frozenset({'USDT', 'USDC', 'BUSD'})
+# Loan assets borrowed without the stability rate penalty
+PREFERRED_LOAN_ASSETS = frozenset({'USDT', 'USDC'})
+
+@dataclass(slots=True, frozen=True)
 class AssetConfig:
     symbol: str
     ltv_max: float
@@ -22,7 +38,7 @@ class AssetConfig:
     loan_rate: float
     volatility_factor: float
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     asset: str
     collateral_amount: float
@@ -38,7 +54,7 @@ class Position:
     entry_price: float = 0.0
     timestamp: datetime = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoanOption:
     asset: str
     rate: float
@@ -46,29 +62,144 @@ class LoanOption:
     min_amount: float
     max_ltv: float
 
+class TokenBucket:
+    """Thread-safe token bucket; acquire() only blocks once the budget is spent"""
+    
+    def __init__(self, capacity: float, refill_rate_per_sec: float):
+        self.capacity = capacity
+        self.refill_rate_per_sec = refill_rate_per_sec
+        self.tokens = float(capacity)
+        self.last_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost: float = 1):
+        with self._lock:
+            now_ns = time.monotonic_ns()
+            self.tokens = min(self.capacity, self.tokens + (now_ns - self.last_ns) / 1e9 * self.refill_rate_per_sec)
+            self.last_ns = now_ns
+            # Reserve immediately so concurrent callers queue behind each other, then sleep off any deficit
+            self.tokens -= cost
+            wait = -self.tokens / self.refill_rate_per_sec if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+# Last formatted second: [epoch second, 'YYYY-mm-dd HH:MM:SS']
+_ts_cache = [0, ""]
+
+def _now_str() -> str:
+    """Current local time as 'YYYY-mm-dd HH:MM:SS', formatted at most once per second"""
+    t = int(time.time())
+    if _ts_cache[0] != t:
+        _ts_cache[1] = datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M:%S')
+        _ts_cache[0] = t
+    return _ts_cache[1]
+
+# Single background event loop for trading, monitoring and close-out. Started on
+# first use rather than at import so gunicorn --preload doesn't fork a dead thread.
+_loop = None
+_loop_lock = threading.Lock()
+
+def _run_coroutine(coro):
+    """Schedule a coroutine on the background loop from any thread; returns a concurrent Future"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="bot-event-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop)
+
 class BinanceAPI:
     """Complete Binance API for earn wallet leverage trading"""
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = False, price_ttl: float = 2.0):
         self.api_key = api_key
         self.api_secret = api_secret
+        self._secret_bytes = api_secret.encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, digestmod=hashlib.sha256)
         self.base_url = "https://testnet.binance.vision" if testnet else "https://api.binance.com"
         self.headers = {'X-MBX-APIKEY': api_key}
         self.logger = logging.getLogger(__name__)
         
+        # Persistent session so keep-alive connections (and TLS) are reused across calls.
+        # Retry only covers idempotent methods; orders/borrows (POST) are never resent.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        # (connect, read): a dead connection fails fast, a slow but live response still gets time
+        self.timeout = (3.05, 10)
+        
+        # Short-lived ticker cache: symbol -> (monotonic timestamp, response), least recently used first
+        self.price_ttl = price_ttl
+        self.price_cache_size = 64
+        self._price_cache: OrderedDict[str, Tuple[float, Dict]] = OrderedDict()
+        self._price_cache_lock = threading.Lock()
+        
+        # Client-side rate limits, so bursts queue here instead of drawing 429s/IP bans.
+        # /api/v3 request weight: 1200 per minute; orders: 50 per 10 seconds
+        self._weight_bucket = TokenBucket(1200, 20)
+        self._order_bucket = TokenBucket(50, 5)
+        self.endpoint_weights = {
+            '/api/v3/account': 20,
+            '/api/v3/exchangeInfo': 20,
+            '/api/v3/ticker/price': 4
+        }
+        self.order_endpoints = {'/api/v3/order', '/sapi/v1/margin/order'}
+        
         self.public_endpoints = {
             '/api/v3/ping',
             '/api/v3/time',
             '/api/v3/ticker/price',
             '/api/v3/exchangeInfo'
         }
+        
+        # Signed timestamps are server time derived from the monotonic clock, so local
+        # clock drift or jumps can't push requests outside recvWindow (-1021).
+        # Synced lazily by the first signed request (never in the constructor, which runs
+        # under the Flask bot lock); until then _timestamp() falls back to wall-clock time.
+        self.time_sync_interval = 3600  # seconds
+        self.time_sync_retry = 60  # seconds before retrying a failed sync
+        self._time_offset_ms = None  # Binance server ms minus local monotonic ms
+        self._time_sync_due = float('-inf')  # monotonic time of the next sync
+        self._time_sync_lock = threading.Lock()
+    
+    def sync_server_time(self) -> bool:
+        """Measure the offset between Binance server time and the local monotonic clock"""
+        before = time.monotonic_ns()
+        result = self._make_request("/api/v3/time", require_auth=False)
+        after = time.monotonic_ns()
+        if "serverTime" not in result:
+            self.logger.warning(f"Server time sync failed: {result.get('message', 'Unknown')}")
+            self._time_sync_due = time.monotonic() + self.time_sync_retry
+            return False
+        
+        # Assume the server stamped the response halfway through the round trip
+        self._time_offset_ms = result['serverTime'] - (before + after) // 2_000_000
+        self._time_sync_due = time.monotonic() + self.time_sync_interval
+        return True
+    
+    def resync_server_time_if_due(self):
+        if time.monotonic() < self._time_sync_due:
+            return
+        # One sync at a time; concurrent signed requests wait for it rather than each syncing
+        with self._time_sync_lock:
+            if time.monotonic() >= self._time_sync_due:
+                self.sync_server_time()
+    
+    def _timestamp(self) -> int:
+        if self._time_offset_ms is None:
+            return time.time_ns() // 1_000_000
+        return self._time_offset_ms + time.monotonic_ns() // 1_000_000
     
     def _generate_signature(self, query_string: str) -> str:
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        # Copying the keyed template skips re-deriving the HMAC pads on every call
+        h = self._hmac_template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
     
     def _make_request(self, endpoint: str, params: Dict = None, method: str = 'GET', require_auth: bool = None) -> Dict:
         if params is None:
@@ -78,26 +209,30 @@ class BinanceAPI:
             require_auth = endpoint not in self.public_endpoints
         
         if require_auth:
-            params['timestamp'] = int(time.time() * 1000)
+            self.resync_server_time_if_due()
+        
+        # Wait for rate budget before stamping, so a queued request isn't signed with a stale timestamp
+        if endpoint.startswith('/api/'):
+            self._weight_bucket.acquire(self.endpoint_weights.get(endpoint, 1))
+        if endpoint in self.order_endpoints:
+            self._order_bucket.acquire()
+        
+        url = f"{self.base_url}{endpoint}"
+        if require_auth:
+            params['timestamp'] = self._timestamp()
             params['recvWindow'] = 60000  # 60 second window
-            query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            params['signature'] = self._generate_signature(query_string)
-            headers = self.headers
-        else:
-            headers = {}
+            # Encode once and sign exactly what goes on the wire
+            query_string = urlencode(params)
+            url = f"{url}?{query_string}&signature={self._generate_signature(query_string)}"
+            params = None
         
         try:
             self.logger.info(f"🔄 {method} {endpoint}")
             
-            if method == 'GET':
-                response = requests.get(f"{self.base_url}{endpoint}", params=params, headers=headers, timeout=15)
-            elif method == 'POST':
-                response = requests.post(f"{self.base_url}{endpoint}", params=params, headers=headers, timeout=15)
-            elif method == 'DELETE':
-                response = requests.delete(f"{self.base_url}{endpoint}", params=params, headers=headers, timeout=15)
+            response = self.session.request(method, url, params=params, timeout=self.timeout)
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 self.logger.info(f"✅ {endpoint} success")
                 return result
             else:
@@ -105,7 +240,7 @@ class BinanceAPI:
                 self.logger.error(f"❌ {endpoint} failed: {response.status_code} - {error_msg[:200]}")
                 
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     return {"error": f"HTTP {response.status_code}", "message": error_data.get('msg', error_msg), "code": error_data.get('code', response.status_code)}
                 except:
                     return {"error": f"HTTP {response.status_code}", "message": error_msg[:200]}
@@ -124,7 +259,44 @@ class BinanceAPI:
         return self._make_request("/api/v3/account", require_auth=True)
     
     def get_symbol_price(self, symbol: str) -> Dict:
-        return self._make_request("/api/v3/ticker/price", {"symbol": symbol}, require_auth=False)
+        now = time.monotonic()
+        with self._price_cache_lock:
+            cached = self._price_cache.get(symbol)
+            if cached and now - cached[0] < self.price_ttl:
+                self._price_cache.move_to_end(symbol)
+                return cached[1]
+        
+        result = self._make_request("/api/v3/ticker/price", {"symbol": symbol}, require_auth=False)
+        if "error" not in result:
+            with self._price_cache_lock:
+                self._price_cache[symbol] = (now, result)
+                self._price_cache.move_to_end(symbol)
+                if len(self._price_cache) > self.price_cache_size:
+                    self._price_cache.popitem(last=False)
+        return result
+    
+    def invalidate_price(self, symbol: str):
+        """Drop a cached ticker so the next lookup hits the exchange"""
+        with self._price_cache_lock:
+            self._price_cache.pop(symbol, None)
+    
+    def get_symbol_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get prices for several symbols in a single request"""
+        result = self._make_request(
+            "/api/v3/ticker/price",
+            {"symbols": json.dumps(symbols, separators=(',', ':'))},
+            require_auth=False
+        )
+        if not isinstance(result, list):
+            return {}
+        
+        prices = {}
+        for price_data in result:
+            try:
+                prices[price_data['symbol']] = float(price_data['price'])
+            except (KeyError, ValueError, TypeError):
+                continue
+        return prices
     
     def get_all_prices(self) -> List[Dict]:
         result = self._make_request("/api/v3/ticker/price", require_auth=False)
@@ -142,6 +314,7 @@ class BinanceAPI:
             'quantity': f"{quantity:.8f}".rstrip('0').rstrip('.')
         }
         params.update(kwargs)
+        self.invalidate_price(symbol)  # Prices read after an order shouldn't predate it
         self.logger.info(f"🔥 PLACING REAL ORDER: {side} {quantity} {symbol}")
         return self._make_request("/api/v3/order", params, method='POST', require_auth=True)
     
@@ -323,6 +496,19 @@ class BinanceAPI:
     def get_margin_account(self) -> Dict:
         """Get margin account details"""
         return self._make_request("/sapi/v1/margin/account", require_auth=True)
+    
+    def place_margin_order(self, symbol: str, side: str, order_type: str, quantity: float, **kwargs) -> Dict:
+        """Place an order in the margin account (e.g. sideEffectType='AUTO_REPAY')"""
+        params = {
+            'symbol': symbol,
+            'side': side,
+            'type': order_type,
+            'quantity': f"{quantity:.8f}".rstrip('0').rstrip('.')
+        }
+        params.update(kwargs)
+        self.invalidate_price(symbol)
+        self.logger.info(f"🔥 PLACING REAL MARGIN ORDER: {side} {quantity} {symbol}")
+        return self._make_request("/sapi/v1/margin/order", params, method='POST', require_auth=True)
 
 class EarnWalletLeverageBot:
     """EARN WALLET LEVERAGE BOT - Creates leveraged positions using Binance's lending products"""
@@ -332,15 +518,23 @@ class EarnWalletLeverageBot:
         self.api_secret = api_secret
         self.testnet = testnet
         
-        # Enhanced logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('earn_leverage_bot.log'),
+        # Enhanced logging - records are formatted by a QueueHandler and written to
+        # file/console by a listener thread, so disk I/O never blocks the trading loop
+        self._log_listener = None
+        if not logging.getLogger().handlers:
+            log_queue = queue.Queue(-1)
+            self._log_listener = QueueListener(
+                log_queue,
+                RotatingFileHandler('earn_leverage_bot.log', maxBytes=10_000_000, backupCount=5),
                 logging.StreamHandler()
-            ]
-        )
+            )
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                handlers=[QueueHandler(log_queue)]
+            )
+            self._log_listener.start()
+            atexit.register(self._log_listener.stop)  # Flush pending records on shutdown
         self.logger = logging.getLogger(__name__)
         
         self.logger.info("="*50)
@@ -354,6 +548,11 @@ class EarnWalletLeverageBot:
         
         # Trading configuration
         self.asset_config = self._initialize_asset_config()
+        # Collateral candidates in cascade order (lower volatility first); config is static
+        self._cascade_order = sorted(
+            ((name, config) for name, config in self.asset_config.items() if name not in STABLECOINS),
+            key=lambda x: x[1].volatility_factor
+        )
         self.max_cascade_levels = 3
         self.target_total_leverage = 2.0
         self.emergency_ltv = 0.85
@@ -376,10 +575,34 @@ class EarnWalletLeverageBot:
         self.is_running = False
         self.bot_status = "Stopped"
         self.price_cache = {}
+        # Symbols the ticker had no price for, with the monotonic time the miss expires
+        self.unpriced_ttl = 60  # seconds
+        self._unpriced_symbols: Dict[str, float] = {}
         self.savings_products_cache = {}
         
+        # Trading rules by symbol, indexed from exchangeInfo on first use
+        self.symbol_info_ttl = 3600  # seconds
+        self._symbol_info: Dict[str, Dict] = {}
+        self._symbol_info_time = float('-inf')
+        self._symbol_info_lock = threading.Lock()
+        
+        # Dashboard polls get_portfolio_status; cache (monotonic timestamp, status, JSON bytes, ETag) briefly
+        self.status_cache_ttl = 1.0
+        self._status_cache = None
+        self._status_lock = threading.Lock()
+        self._last_status_time_str = None  # Stamped whenever state is saved (incl. each monitor tick)
+        # Balances cost a signed account call (weight 20) plus savings and loan calls, so every
+        # poller within the TTL shares one fetch: (monotonic timestamp, balances)
+        self.balances_cache_ttl = 15.0
+        self._balances_cache = None
+        self._balances_lock = threading.Lock()
+        # Position rows and totals only change with positions or prices; rebuilt when dirty
+        self._positions_view = None
+        self._positions_dirty = True
+        
         # Monitoring
         self.monitoring_task = None
+        self.trading_task = None  # start_trading while its cascade runs, so close-out can wait for it
         self.monitoring_interval = 30  # seconds
         
         # Persistence
@@ -434,6 +657,9 @@ class EarnWalletLeverageBot:
     
     def _save_positions(self):
         """Save positions to file for persistence"""
+        self._status_cache = None  # Every state change goes through here
+        self._positions_dirty = True
+        self._last_status_time_str = _now_str()
         try:
             positions_data = []
             for pos in self.positions:
@@ -499,7 +725,7 @@ class EarnWalletLeverageBot:
                         self.bot_status = "Resumed (Monitoring)"
                         self.is_running = True
                         # Start monitoring
-                        asyncio.create_task(self._start_monitoring())
+                        self.monitoring_task = _run_coroutine(self._start_monitoring())
                     
                     self.logger.info(f"📂 Loaded {len(self.positions)} positions from file")
                     
@@ -510,28 +736,34 @@ class EarnWalletLeverageBot:
     def _update_price_cache(self):
         """Load current prices for our assets only"""
         try:
-            all_prices = self.binance_api.get_all_prices()
-            if all_prices and isinstance(all_prices, list):
-                self.price_cache = {}
-                
-                # Get prices for our configured assets and borrowing assets
-                assets_to_check = list(self.asset_config.keys()) + self.borrowing_assets
-                
-                for asset in set(assets_to_check):
-                    if asset == 'USDT':
-                        self.price_cache['USDTUSDT'] = 1.0
-                        continue
-                    
-                    symbol = f"{asset}USDT"
-                    for price_data in all_prices:
-                        if isinstance(price_data, dict) and price_data.get('symbol') == symbol:
-                            try:
-                                price = price_data.get('price', '0')
-                                self.price_cache[symbol] = float(price)
-                                break
-                            except (ValueError, TypeError):
-                                continue
-                
+            # Get prices for our configured assets and borrowing assets in one request
+            assets_to_check = set(self.asset_config.keys()) | set(self.borrowing_assets)
+            symbols = sorted(f"{asset}USDT" for asset in assets_to_check if asset != 'USDT')
+            
+            # Binance rejects the whole batch if any symbol is unlisted (-1121), and the config
+            # includes delisted pairs, so only ask for symbols exchangeInfo lists as trading
+            symbol_index = self._get_symbol_index()
+            if symbol_index:
+                listed = [s for s in symbols if symbol_index.get(s, {}).get('status') == 'TRADING']
+                expiry = time.monotonic() + self.unpriced_ttl
+                for symbol in set(symbols) - set(listed):
+                    self._unpriced_symbols[symbol] = expiry
+                symbols = listed
+            
+            prices = self.binance_api.get_symbol_prices(symbols)
+            if not prices:
+                # Without an exchangeInfo index the batch can still be rejected as a whole - fall back to the full ticker
+                wanted = set(symbols)
+                for price_data in self.binance_api.get_all_prices():
+                    if isinstance(price_data, dict) and price_data.get('symbol') in wanted:
+                        try:
+                            prices[price_data['symbol']] = float(price_data.get('price', '0'))
+                        except (ValueError, TypeError):
+                            continue
+            
+            if prices:
+                self.price_cache = {'USDTUSDT': 1.0}
+                self.price_cache.update(prices)
                 self.logger.info(f"📊 Price cache updated: {len(self.price_cache)} assets")
             else:
                 self.logger.warning("Failed to get price data from API")
@@ -540,6 +772,7 @@ class EarnWalletLeverageBot:
         except Exception as e:
             self.logger.error(f"Error updating price cache: {e}")
             self.price_cache = {'USDTUSDT': 1.0}
+        self._positions_dirty = True
     
     def _load_savings_products(self):
         """Load available savings products (Simple Earn)"""
@@ -615,7 +848,7 @@ class EarnWalletLeverageBot:
         
         # Assume all our configured assets have savings products (except USDT)
         for asset in self.asset_config.keys():
-            if asset not in ['USDT', 'USDC', 'BUSD']:  # Skip stablecoins as collateral
+            if asset not in STABLECOINS:  # Skip stablecoins as collateral
                 self.savings_products_cache[asset] = {
                     'asset': asset,
                     'productId': f"{asset}001",  # Placeholder ID
@@ -630,10 +863,18 @@ class EarnWalletLeverageBot:
         try:
             self.loan_data_cache = {}
             
+            # The per-asset loan queries and the collateral query are independent: fetch them together
+            api = self.binance_api
+            with ThreadPoolExecutor(max_workers=len(self.borrowing_assets) + 1,
+                                    thread_name_prefix="binance-loans") as pool:
+                loan_futures = {loan_asset: pool.submit(api.get_loan_data, loan_coin=loan_asset)
+                                for loan_asset in self.borrowing_assets}
+                collateral_future = pool.submit(api.get_collateral_data)
+            
             # Get loan data for each borrowing asset
-            for loan_asset in self.borrowing_assets:
+            for loan_asset, loan_future in loan_futures.items():
                 try:
-                    loan_data = self.binance_api.get_loan_data(loan_coin=loan_asset)
+                    loan_data = loan_future.result()
                     if loan_data and isinstance(loan_data, dict) and "rows" in loan_data:
                         for row in loan_data["rows"]:
                             if not isinstance(row, dict):
@@ -663,7 +904,7 @@ class EarnWalletLeverageBot:
             
             # Get collateral data
             try:
-                collateral_data = self.binance_api.get_collateral_data()
+                collateral_data = collateral_future.result()
                 if collateral_data and isinstance(collateral_data, list):
                     self.collateral_data_cache = {}
                     for data in collateral_data:
@@ -698,10 +939,9 @@ class EarnWalletLeverageBot:
             best_rate = float('inf')
             
             for loan_asset in self.borrowing_assets:
-                key = f"{collateral_asset}_{loan_asset}"
+                loan_data = self.loan_data_cache.get(f"{collateral_asset}_{loan_asset}")
                 
-                if key in self.loan_data_cache:
-                    loan_data = self.loan_data_cache[key]
+                if loan_data:
                     yearly_rate = loan_data['yearly_rate']
                     min_limit = loan_data['min_limit']
                     max_limit = loan_data['max_limit']
@@ -710,7 +950,7 @@ class EarnWalletLeverageBot:
                     if min_limit <= loan_amount <= max_limit:
                         # Consider liquidity and stability
                         rate_penalty = 0
-                        if loan_asset not in ['USDT', 'USDC']:
+                        if loan_asset not in PREFERRED_LOAN_ASSETS:
                             rate_penalty = 0.02  # 2% penalty for less stable assets
                         
                         effective_rate = yearly_rate + rate_penalty
@@ -739,16 +979,22 @@ class EarnWalletLeverageBot:
         
         symbol = f"{asset}USDT"
         
-        # Check cache first
-        if symbol in self.price_cache:
-            return self.price_cache[symbol]
+        # Check cache first (a zero price is a miss, never a real price)
+        price = self.price_cache.get(symbol, 0.0)
+        if price > 0:
+            return price
+        
+        # Recently confirmed unpriced: don't retry it one symbol at a time
+        if self._unpriced_symbols.get(symbol, 0.0) > time.monotonic():
+            return 0.0
         
         # Fallback API call
         try:
             price_data = self.binance_api.get_symbol_price(symbol)
             if price_data and "price" in price_data and "error" not in price_data:
                 price = float(price_data['price'])
-                self.price_cache[symbol] = price
+                if price > 0:
+                    self.price_cache[symbol] = price
                 return price
             else:
                 self.logger.warning(f"No price data for {symbol}: {price_data}")
@@ -757,17 +1003,59 @@ class EarnWalletLeverageBot:
         
         return 0.0
     
-    def _get_symbol_info(self, symbol: str) -> Dict:
-        """Get trading symbol information"""
+    def _prefetch_prices(self, assets):
+        """Fill price_cache for all given assets with one ticker request instead of one per asset"""
+        now = time.monotonic()
+        self._unpriced_symbols = {symbol: expiry for symbol, expiry in self._unpriced_symbols.items() if expiry > now}
+        missing = {
+            f"{asset}USDT" for asset in assets
+            if asset != 'USDT' and self.price_cache.get(f"{asset}USDT", 0.0) <= 0
+        } - self._unpriced_symbols.keys()
+        if not missing:
+            return
+        
+        # Full ticker rather than the batched symbols call: balances can hold assets with no USDT pair
         try:
-            exchange_info = self.binance_api.get_exchange_info()
-            if exchange_info and "symbols" in exchange_info and isinstance(exchange_info["symbols"], list):
-                for s in exchange_info["symbols"]:
-                    if isinstance(s, dict) and s.get("symbol") == symbol:
-                        return s
+            all_prices = self.binance_api.get_all_prices()
+            if not all_prices:
+                return
+            for price_data in all_prices:
+                if isinstance(price_data, dict) and price_data.get('symbol') in missing:
+                    try:
+                        price = float(price_data.get('price', '0'))
+                    except (ValueError, TypeError):
+                        continue
+                    if price > 0:
+                        self.price_cache[price_data['symbol']] = price
+            # Remember unpriced symbols briefly so _get_asset_price doesn't retry them one by one
+            expiry = now + self.unpriced_ttl
+            for symbol in missing - self.price_cache.keys():
+                self._unpriced_symbols[symbol] = expiry
         except Exception as e:
-            self.logger.error(f"Error getting symbol info: {e}")
-        return {}
+            self.logger.error(f"Error prefetching prices: {e}")
+    
+    def _get_symbol_info(self, symbol: str) -> Dict:
+        """Get trading symbol information"""
+        return self._get_symbol_index(symbol).get(symbol, {})
+    
+    def _get_symbol_index(self, symbol: str = None) -> Dict[str, Dict]:
+        """exchangeInfo symbols by name, refreshed at most once per symbol_info_ttl"""
+        # exchangeInfo covers every listed symbol (megabytes); download it once and index by name.
+        # An unknown symbol only forces a refresh once the index is older than symbol_info_ttl.
+        with self._symbol_info_lock:
+            stale = time.monotonic() - self._symbol_info_time >= self.symbol_info_ttl
+            if stale and (not self._symbol_info or symbol is None or symbol not in self._symbol_info):
+                try:
+                    exchange_info = self.binance_api.get_exchange_info()
+                    if exchange_info and "symbols" in exchange_info and isinstance(exchange_info["symbols"], list):
+                        self._symbol_info = {
+                            s["symbol"]: s for s in exchange_info["symbols"]
+                            if isinstance(s, dict) and "symbol" in s
+                        }
+                        self._symbol_info_time = time.monotonic()
+                except Exception as e:
+                    self.logger.error(f"Error getting symbol info: {e}")
+            return self._symbol_info
     
     def _format_quantity(self, symbol: str, quantity: float) -> float:
         """Format quantity according to symbol requirements"""
@@ -788,11 +1076,12 @@ class EarnWalletLeverageBot:
     
     async def start_trading(self, initial_capital: float):
         """Start EARN WALLET leverage trading"""
+        self.trading_task = asyncio.current_task()
         try:
             self.logger.info(f"🚀 STARTING EARN WALLET LEVERAGE WITH ${initial_capital}")
             
             # Validate account
-            account_info = self.binance_api.get_account_info()
+            account_info = await self._api_call(self.binance_api.get_account_info)
             if "error" in account_info:
                 raise Exception(f"Account error: {account_info['message']}")
             
@@ -813,18 +1102,27 @@ class EarnWalletLeverageBot:
             if usdt_balance < initial_capital:
                 raise Exception(f"Insufficient USDT: Available ${usdt_balance:.2f}, Need ${initial_capital:.2f}")
             
+            if self.bot_status == "Closing Earn Positions":
+                self.logger.warning("⚠️ Positions are being closed - not starting a new cascade")
+                return
+            
             self.total_capital = initial_capital
             self.is_running = True
             self.bot_status = "Executing Earn Strategy"
             
             # Reload latest data
-            self._update_price_cache()
-            self._load_loan_data()
+            await self._api_call(self._update_price_cache)
+            await self._api_call(self._load_loan_data)
             
             # Execute earn wallet cascade strategy
             self.logger.info("🏦 EXECUTING EARN WALLET LEVERAGE STRATEGY")
             await self._execute_earn_cascade_strategy(initial_capital)
             
+            if not self.is_running:
+                # Stopped mid-cascade: the close-out waits for us and takes over from here
+                self.logger.info("🛑 Cascade stopped early - not starting monitoring")
+                return
+            
             # Start monitoring positions
             self.monitoring_task = asyncio.create_task(self._start_monitoring())
             
@@ -852,11 +1150,11 @@ class EarnWalletLeverageBot:
             
             # Filter assets that have both price and savings product (or just price if margin mode)
             available_assets = []
-            for asset_name, asset_config in self.asset_config.items():
-                if asset_name in ['USDT', 'USDC', 'BUSD']:  # Skip stablecoins as collateral
-                    continue
-                    
-                price = self._get_asset_price(asset_name)
+            priced_assets = []
+            for asset_name, asset_config in self._cascade_order:
+                price = await self._api_call(self._get_asset_price, asset_name)
+                if price > 0:
+                    priced_assets.append((asset_name, asset_config))
                 has_savings = asset_name in self.savings_products_cache
                 
                 self.logger.info(f"🔍 {asset_name}: Price=${price:.2f}, Has Savings={has_savings}")
@@ -881,27 +1179,26 @@ class EarnWalletLeverageBot:
                 # Log what's missing
                 self.logger.error(f"❌ No valid assets found!")
                 self.logger.error(f"   - Total configured assets: {len(self.asset_config)}")
-                self.logger.error(f"   - Assets with prices: {len([a for a in self.asset_config if self._get_asset_price(a) > 0])}")
+                self.logger.error(f"   - Assets with prices: {len(priced_assets)}")
                 self.logger.error(f"   - Assets with savings: {len(self.savings_products_cache)}")
                 
                 # If we have no savings products at all, try a direct approach
                 if len(self.savings_products_cache) == 0:
                     self.logger.warning("🔄 No savings products loaded, using direct deposit approach")
                     # Use assets that have prices at least
-                    for asset_name, asset_config in self.asset_config.items():
-                        if asset_name != 'USDT' and self._get_asset_price(asset_name) > 0:
-                            available_assets.append((asset_name, asset_config))
+                    available_assets.extend(priced_assets)
                 
                 if not available_assets:
                     raise Exception("No valid assets available for earn strategy - check API connection and balances")
             
-            # Sort by safety (lower volatility first)
-            available_assets.sort(key=lambda x: x[1].volatility_factor)
-            
             self.logger.info(f"🎯 EXECUTING {min(self.max_cascade_levels, len(available_assets))} LEVEL CASCADE")
             self.logger.info(f"📋 Available assets: {', '.join([a[0] for a in available_assets])}")
             
             for level in range(min(self.max_cascade_levels, len(available_assets))):
+                if not self.is_running:
+                    self.logger.warning(f"🛑 Stop requested - ending cascade before level {level + 1}")
+                    break
+                
                 if current_capital < 15:  # Lower minimum for wider testing
                     self.logger.warning(f"Capital too low: ${current_capital:.2f}")
                     break
@@ -929,8 +1226,8 @@ class EarnWalletLeverageBot:
                 else:
                     self.logger.error(f"❌ LEVEL {level + 1} FAILED - Stopping cascade")
                     break
-                    
-                # Wait between levels
+                
+                # The next level's market buy spends these loan proceeds, so give them time to settle
                 await asyncio.sleep(5)
             
             self.logger.info(f"🎉 EARN CASCADE COMPLETE - Total leveraged: ${self.leveraged_capital:.2f}")
@@ -947,7 +1244,7 @@ class EarnWalletLeverageBot:
             self.logger.info(f"💰 Collateral: ${collateral_amount:.2f} | Max Loan: ${max_loan_amount:.2f}")
             
             # 1. GET CURRENT PRICE
-            asset_price = self._get_asset_price(asset)
+            asset_price = await self._api_call(self._get_asset_price, asset)
             if asset_price <= 0:
                 self.logger.error(f"❌ Invalid price for {asset}: {asset_price}")
                 return False, 0
@@ -960,7 +1257,7 @@ class EarnWalletLeverageBot:
             # 3. BUY ASSET ON SPOT
             symbol = f"{asset}USDT"
             raw_quantity = collateral_amount / asset_price
-            quantity = self._format_quantity(symbol, raw_quantity)
+            quantity = await self._api_call(self._format_quantity, symbol, raw_quantity)
             
             if quantity <= 0:
                 self.logger.error(f"❌ Invalid quantity calculated: {quantity}")
@@ -968,7 +1265,8 @@ class EarnWalletLeverageBot:
             
             self.logger.info(f"🛒 Buying {quantity} {asset} for earn wallet")
             
-            buy_order = self.binance_api.place_order(
+            buy_order = await self._api_call(
+                self.binance_api.place_order,
                 symbol=symbol,
                 side='BUY',
                 order_type='MARKET',
@@ -990,14 +1288,14 @@ class EarnWalletLeverageBot:
                 self.logger.info(f"🔄 Using margin mode (no savings products available)")
                 
                 # Transfer to margin account
-                transfer_result = self.binance_api.transfer_to_margin(asset, quantity)
+                transfer_result = await self._api_call(self.binance_api.transfer_to_margin, asset, quantity)
                 if "error" not in transfer_result:
                     self.logger.info(f"✅ Transferred {quantity} {asset} to margin")
                     
                     await asyncio.sleep(3)
                     
                     # Borrow USDT in margin
-                    margin_borrow_result = self.binance_api.margin_borrow('USDT', max_loan_amount)
+                    margin_borrow_result = await self._api_call(self.binance_api.margin_borrow, 'USDT', max_loan_amount)
                     if "error" not in margin_borrow_result:
                         self.logger.info(f"✅ MARGIN BORROW SUCCESS: ${max_loan_amount} USDT")
                         
@@ -1028,11 +1326,11 @@ class EarnWalletLeverageBot:
                         return True, max_loan_amount
                     else:
                         self.logger.error(f"❌ Margin borrow failed: {margin_borrow_result.get('message', 'Unknown error')}")
-                        self._emergency_sell(asset, quantity)
+                        await self._api_call(self._emergency_sell, asset, quantity)
                         return False, 0
                 else:
                     self.logger.error(f"❌ Margin transfer failed: {transfer_result.get('message', 'Unknown error')}")
-                    self._emergency_sell(asset, quantity)
+                    await self._api_call(self._emergency_sell, asset, quantity)
                     return False, 0
             
             # Regular savings flow
@@ -1046,7 +1344,7 @@ class EarnWalletLeverageBot:
                 if product_id:
                     self.logger.info(f"💰 Depositing {quantity} {asset} to savings...")
                     
-                    deposit_result = self.binance_api.purchase_savings_product(product_id, quantity)
+                    deposit_result = await self._api_call(self.binance_api.purchase_savings_product, product_id, quantity)
                     
                     if "error" in deposit_result:
                         self.logger.error(f"❌ SAVINGS DEPOSIT FAILED: {deposit_result['message']}")
@@ -1070,15 +1368,16 @@ class EarnWalletLeverageBot:
             # Adjust loan amount based on optimal loan asset price if not USDT
             actual_loan_amount = max_loan_amount
             if optimal_loan_asset != 'USDT':
-                loan_asset_price = self._get_asset_price(optimal_loan_asset)
+                loan_asset_price = await self._api_call(self._get_asset_price, optimal_loan_asset)
                 if loan_asset_price > 0:
                     # Convert USD value to loan asset amount
                     actual_loan_amount = max_loan_amount / loan_asset_price
             
             self.logger.info(f"🏦 Applying for crypto loan: {actual_loan_amount:.4f} {optimal_loan_asset} using {asset}")
             
-            loan_result = self.binance_api.apply_crypto_loan(
-                optimal_loan_asset, 
+            loan_result = await self._api_call(
+                self.binance_api.apply_crypto_loan,
+                optimal_loan_asset,
                 asset, 
                 actual_loan_amount
             )
@@ -1090,7 +1389,7 @@ class EarnWalletLeverageBot:
                 # If loan failed and we deposited to savings, try to withdraw
                 if product_id and deposit_result and "error" not in deposit_result:
                     try:
-                        self.binance_api.redeem_savings_product(product_id, quantity)
+                        await self._api_call(self.binance_api.redeem_savings_product, product_id, quantity)
                         self.logger.info(f"🔄 Withdrew {quantity} {asset} from savings after loan failure")
                         await asyncio.sleep(3)
                     except:
@@ -1101,12 +1400,12 @@ class EarnWalletLeverageBot:
                     self.logger.warning(f"⚠️ Attempting margin borrow as fallback")
                     
                     # Transfer to margin account
-                    transfer_result = self.binance_api.transfer_to_margin(asset, quantity)
+                    transfer_result = await self._api_call(self.binance_api.transfer_to_margin, asset, quantity)
                     if "error" not in transfer_result:
                         self.logger.info(f"✅ Transferred {quantity} {asset} to margin")
                         
                         # Borrow USDT in margin
-                        margin_borrow_result = self.binance_api.margin_borrow('USDT', max_loan_amount)
+                        margin_borrow_result = await self._api_call(self.binance_api.margin_borrow, 'USDT', max_loan_amount)
                         if "error" not in margin_borrow_result:
                             self.logger.info(f"✅ MARGIN BORROW SUCCESS: ${max_loan_amount} USDT")
                             
@@ -1143,7 +1442,7 @@ class EarnWalletLeverageBot:
                     self.logger.warning("⚠️ Margin fallback disabled")
                 
                 # If all fails, sell back the asset
-                self._emergency_sell(asset, quantity)
+                await self._api_call(self._emergency_sell, asset, quantity)
                 return False, 0
             
             loan_order_id = loan_result.get('orderId', 'N/A')
@@ -1151,7 +1450,7 @@ class EarnWalletLeverageBot:
             
             # Convert loan amount to USD if needed
             if optimal_loan_asset != 'USDT':
-                loan_asset_price = self._get_asset_price(optimal_loan_asset)
+                loan_asset_price = await self._api_call(self._get_asset_price, optimal_loan_asset)
                 actual_loan_in_usd = actual_loan_amount * loan_asset_price
             
             self.logger.info(f"✅ CRYPTO LOAN APPROVED: {actual_loan_amount:.4f} {optimal_loan_asset} (${actual_loan_in_usd:.2f} USD) - Order: {loan_order_id}")
@@ -1162,9 +1461,10 @@ class EarnWalletLeverageBot:
                 self.logger.info(f"💱 Converting {actual_loan_amount} {optimal_loan_asset} to USDT")
                 
                 convert_symbol = f"{optimal_loan_asset}USDT"
-                convert_quantity = self._format_quantity(convert_symbol, actual_loan_amount)
+                convert_quantity = await self._api_call(self._format_quantity, convert_symbol, actual_loan_amount)
                 
-                convert_order = self.binance_api.place_order(
+                convert_order = await self._api_call(
+                    self.binance_api.place_order,
                     symbol=convert_symbol,
                     side='SELL',
                     order_type='MARKET',
@@ -1227,6 +1527,10 @@ class EarnWalletLeverageBot:
         except Exception as e:
             self.logger.error(f"❌ Emergency sell error: {e}")
     
+    async def _api_call(self, func, *args, **kwargs):
+        """Run a blocking Binance API call in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(func, *args, **kwargs)
+    
     async def _start_monitoring(self):
         """Start monitoring positions for LTV"""
         self.logger.info("👁️ Starting position monitoring")
@@ -1247,11 +1551,12 @@ class EarnWalletLeverageBot:
             
             self.logger.info("🔍 Monitoring positions...")
             
-            # Update prices
-            self._update_price_cache()
-            
-            # Get latest loan orders
-            loan_orders = self.binance_api.get_loan_orders()
+            # Update prices and get latest loan orders concurrently (hourly server time resync alongside)
+            _, loan_orders, _ = await asyncio.gather(
+                self._api_call(self._update_price_cache),
+                self._api_call(self.binance_api.get_loan_orders),
+                self._api_call(self.binance_api.resync_server_time_if_due)
+            )
             loan_orders_dict = {}
             if loan_orders:
                 for order in loan_orders:
@@ -1259,10 +1564,10 @@ class EarnWalletLeverageBot:
                     if order_id:
                         loan_orders_dict[order_id] = order
             
-            # Check each position
-            for position in self.positions:
+            # Check each position (copy: emergency liquidation removes from the list)
+            for position in self.positions.copy():
                 # Get current price
-                current_price = self._get_asset_price(position.asset)
+                current_price = await self._api_call(self._get_asset_price, position.asset)
                 if current_price <= 0:
                     continue
                 
@@ -1272,7 +1577,11 @@ class EarnWalletLeverageBot:
                 # Get loan value in USD
                 loan_value_usd = position.loan_amount
                 if position.loan_asset != 'USDT':
-                    loan_asset_price = self._get_asset_price(position.loan_asset)
+                    loan_asset_price = await self._api_call(self._get_asset_price, position.loan_asset)
+                    if loan_asset_price <= 0:
+                        # A zero loan value would report a 0% LTV and hide real risk
+                        self.logger.warning(f"⚠️ No price for loan asset {position.loan_asset} - skipping LTV check")
+                        continue
                     loan_value_usd = position.loan_amount * loan_asset_price
                 
                 # Update LTV
@@ -1286,11 +1595,12 @@ class EarnWalletLeverageBot:
                     position.current_ltv = actual_ltv
                 
                 # Log position status
-                status_emoji = "✅" if current_ltv < self.warning_ltv else "⚠️" if current_ltv < self.emergency_ltv else "🚨"
+                status_emoji = "✅" if position.current_ltv < self.warning_ltv else "⚠️" if position.current_ltv < self.emergency_ltv else "🚨"
+                price_change = (current_price / position.entry_price - 1) * 100 if position.entry_price > 0 else 0
                 self.logger.info(
                     f"{status_emoji} Position {position.level} - {position.asset}: "
                     f"LTV {position.current_ltv:.1%} | "
-                    f"Price ${current_price:.2f} ({((current_price/position.entry_price - 1) * 100):.1f}% change)"
+                    f"Price ${current_price:.2f} ({price_change:.1f}% change)"
                 )
                 
                 # Check for emergency liquidation
@@ -1313,6 +1623,30 @@ class EarnWalletLeverageBot:
         try:
             self.logger.info(f"🚨 EMERGENCY LIQUIDATING: {position.asset} position")
             
+            # Margin positions: one AUTO_REPAY sell closes the collateral and repays the
+            # USDT loan from the proceeds, instead of repay -> transfer -> spot sell
+            if position.loan_order_id == 'MARGIN':
+                symbol = f"{position.asset}USDT"
+                sell_quantity = await self._api_call(self._format_quantity, symbol, position.collateral_amount)
+                sell_order = await self._api_call(
+                    self.binance_api.place_margin_order,
+                    symbol=symbol,
+                    side='SELL',
+                    order_type='MARKET',
+                    quantity=sell_quantity,
+                    sideEffectType='AUTO_REPAY'
+                )
+                
+                if "error" in sell_order:
+                    self.logger.error(f"❌ MARGIN AUTO_REPAY SELL FAILED: {sell_order['message']}")
+                    return
+                
+                self.logger.info(f"✅ SOLD {position.asset} WITH AUTO_REPAY - Order: {sell_order.get('orderId')}")
+                self.positions.remove(position)
+                self._save_positions()
+                self.logger.info(f"✅ EMERGENCY LIQUIDATION COMPLETE: {position.asset}")
+                return
+            
             # 1. Repay loan first
             if position.loan_order_id:
                 repay_amount = position.loan_amount * 1.01  # Add 1% buffer for interest
@@ -1321,9 +1655,10 @@ class EarnWalletLeverageBot:
                 if position.loan_asset != 'USDT':
                     self.logger.info(f"💱 Buying {position.loan_asset} for repayment")
                     buy_symbol = f"{position.loan_asset}USDT"
-                    buy_quantity = self._format_quantity(buy_symbol, repay_amount)
+                    buy_quantity = await self._api_call(self._format_quantity, buy_symbol, repay_amount)
                     
-                    buy_order = self.binance_api.place_order(
+                    buy_order = await self._api_call(
+                        self.binance_api.place_order,
                         symbol=buy_symbol,
                         side='BUY',
                         order_type='MARKET',
@@ -1337,7 +1672,7 @@ class EarnWalletLeverageBot:
                     await asyncio.sleep(2)
                 
                 # Repay the loan
-                repay_result = self.binance_api.repay_crypto_loan(position.loan_order_id, repay_amount)
+                repay_result = await self._api_call(self.binance_api.repay_crypto_loan, position.loan_order_id, repay_amount)
                 
                 if "error" not in repay_result:
                     self.logger.info(f"✅ LOAN REPAID: {repay_amount} {position.loan_asset}")
@@ -1348,7 +1683,8 @@ class EarnWalletLeverageBot:
             # 2. Withdraw from savings
             if position.earn_product_id:
                 await asyncio.sleep(3)
-                withdraw_result = self.binance_api.redeem_savings_product(
+                withdraw_result = await self._api_call(
+                    self.binance_api.redeem_savings_product,
                     position.earn_product_id, position.collateral_amount
                 )
                 
@@ -1360,7 +1696,7 @@ class EarnWalletLeverageBot:
             
             # 3. Sell the asset
             await asyncio.sleep(3)
-            self._emergency_sell(position.asset, position.collateral_amount)
+            await self._api_call(self._emergency_sell, position.asset, position.collateral_amount)
             
             # 4. Remove position
             self.positions.remove(position)
@@ -1372,19 +1708,55 @@ class EarnWalletLeverageBot:
             self.logger.error(f"❌ Emergency liquidation failed: {e}")
     
     def stop_trading(self):
-        """Stop trading and close all earn positions"""
+        """Stop trading and close all earn positions in the background"""
         try:
+            if self.bot_status == "Closing Earn Positions":
+                self.logger.info("⏳ Positions are already being closed")
+                return
+            
             self.logger.info("🛑 STOPPING EARN TRADING - CLOSING POSITIONS")
             self.is_running = False
             self.bot_status = "Closing Earn Positions"
             
-            # Cancel monitoring
-            if self.monitoring_task:
-                self.monitoring_task.cancel()
+            # Cancel monitoring (the task lives on the background loop)
+            if self.monitoring_task and _loop:
+                _loop.call_soon_threadsafe(self.monitoring_task.cancel)
             
-            # Close all positions in reverse order
-            for position in reversed(self.positions.copy()):
-                self._close_earn_position(position)
+            # Closing waits on order settlement, so don't hold the request thread
+            _run_coroutine(self._close_all_positions())
+            
+        except Exception as e:
+            self.logger.error(f"❌ EARN POSITION CLOSING ERROR: {e}")
+            self.bot_status = "Error"
+    
+    async def _close_all_positions(self):
+        """Close all earn positions"""
+        try:
+            # A cascade in flight stops at its next level boundary; wait for it so the
+            # position it is opening now gets closed too
+            trading_task = self.trading_task
+            if trading_task and not trading_task.done():
+                self.logger.info("⏳ Waiting for the running cascade to stop")
+                await asyncio.wait({trading_task})
+            
+            # Each level was bought with the loan taken at the level below it, whether that loan
+            # is a crypto loan or margin. Unwind strictly top-down so a level's collateral is only
+            # released after every loan above it is repaid, and its sale proceeds are there to
+            # repay the loan beneath. Positions at the same level come from separate cascades and
+            # don't fund each other, so only those close concurrently.
+            positions_by_level = {}
+            for position in reversed(self.positions):
+                positions_by_level.setdefault(position.level, []).append(position)
+            
+            for level in sorted(positions_by_level, reverse=True):
+                level_positions = positions_by_level[level]
+                results = await asyncio.gather(
+                    *(self._close_earn_position(p) for p in level_positions),
+                    return_exceptions=True
+                )
+                for position, result in zip(level_positions, results):
+                    if isinstance(result, Exception):
+                        self.logger.error(f"❌ EARN POSITION CLOSE FAILED: {position.asset} - {result}")
             
             self.positions.clear()
             self.leveraged_capital = 0
@@ -1400,7 +1772,7 @@ class EarnWalletLeverageBot:
             self.logger.error(f"❌ EARN POSITION CLOSING ERROR: {e}")
             self.bot_status = "Error"
     
-    def _close_earn_position(self, position: Position):
+    async def _close_earn_position(self, position: Position):
         """Close a single earn position"""
         try:
             self.logger.info(f"💥 CLOSING EARN POSITION: {position.asset} Level {position.level}")
@@ -1410,15 +1782,16 @@ class EarnWalletLeverageBot:
                 self.logger.info(f"🔄 Closing margin position")
                 
                 # Repay margin loan
-                repay_result = self.binance_api.margin_repay('USDT', position.loan_amount * 1.01)
+                repay_result = await self._api_call(self.binance_api.margin_repay, 'USDT', position.loan_amount * 1.01)
                 if "error" not in repay_result:
                     self.logger.info(f"✅ MARGIN LOAN REPAID: {position.loan_amount} USDT")
                 else:
                     self.logger.error(f"❌ Margin repay failed: {repay_result['message']}")
                 
                 # Transfer back to spot
-                time.sleep(2)
-                transfer_result = self.binance_api._make_request(
+                await asyncio.sleep(2)
+                transfer_result = await self._api_call(
+                    self.binance_api._make_request,
                     "/sapi/v1/margin/transfer",
                     {
                         'asset': position.asset,
@@ -1433,11 +1806,12 @@ class EarnWalletLeverageBot:
                     self.logger.info(f"✅ Transferred {position.asset} back to spot")
                 
                 # Sell the asset
-                time.sleep(2)
+                await asyncio.sleep(2)
                 symbol = f"{position.asset}USDT"
-                sell_quantity = self._format_quantity(symbol, position.collateral_amount)
+                sell_quantity = await self._api_call(self._format_quantity, symbol, position.collateral_amount)
                 
-                sell_order = self.binance_api.place_order(
+                sell_order = await self._api_call(
+                    self.binance_api.place_order,
                     symbol=symbol,
                     side='SELL',
                     order_type='MARKET',
@@ -1459,9 +1833,10 @@ class EarnWalletLeverageBot:
                 if position.loan_asset != 'USDT':
                     self.logger.info(f"💱 Buying {position.loan_asset} for repayment")
                     buy_symbol = f"{position.loan_asset}USDT"
-                    buy_quantity = self._format_quantity(buy_symbol, repay_amount)
+                    buy_quantity = await self._api_call(self._format_quantity, buy_symbol, repay_amount)
                     
-                    buy_order = self.binance_api.place_order(
+                    buy_order = await self._api_call(
+                        self.binance_api.place_order,
                         symbol=buy_symbol,
                         side='BUY',
                         order_type='MARKET',
@@ -1471,10 +1846,10 @@ class EarnWalletLeverageBot:
                     if "error" in buy_order:
                         self.logger.error(f"❌ Failed to buy {position.loan_asset} for repayment")
                     else:
-                        time.sleep(2)
+                        await asyncio.sleep(2)
                 
                 self.logger.info(f"💳 Repaying loan: {position.loan_order_id}")
-                repay_result = self.binance_api.repay_crypto_loan(position.loan_order_id, repay_amount)
+                repay_result = await self._api_call(self.binance_api.repay_crypto_loan, position.loan_order_id, repay_amount)
                 
                 if "error" not in repay_result:
                     self.logger.info(f"✅ LOAN REPAID: {repay_amount} {position.loan_asset}")
@@ -1483,10 +1858,11 @@ class EarnWalletLeverageBot:
             
             # 2. Withdraw from savings
             if position.earn_product_id:
-                time.sleep(3)
+                await asyncio.sleep(3)
                 self.logger.info(f"💸 Withdrawing from savings: {position.collateral_amount} {position.asset}")
                 
-                withdraw_result = self.binance_api.redeem_savings_product(
+                withdraw_result = await self._api_call(
+                    self.binance_api.redeem_savings_product,
                     position.earn_product_id, position.collateral_amount
                 )
                 
@@ -1496,11 +1872,12 @@ class EarnWalletLeverageBot:
                     self.logger.error(f"❌ WITHDRAW FAILED: {withdraw_result['message']}")
             
             # 3. Sell the asset
-            time.sleep(3)
+            await asyncio.sleep(3)
             symbol = f"{position.asset}USDT"
-            sell_quantity = self._format_quantity(symbol, position.collateral_amount)
+            sell_quantity = await self._api_call(self._format_quantity, symbol, position.collateral_amount)
             
-            sell_order = self.binance_api.place_order(
+            sell_order = await self._api_call(
+                self.binance_api.place_order,
                 symbol=symbol,
                 side='SELL',
                 order_type='MARKET',
@@ -1516,13 +1893,67 @@ class EarnWalletLeverageBot:
             self.logger.error(f"❌ EARN POSITION CLOSE FAILED: {e}")
     
     def get_portfolio_status(self) -> Dict:
-        """Get current portfolio status"""
+        """Get current portfolio status, reusing a recent result for rapid polls"""
+        return self._get_status_snapshot()[1]
+    
+    def get_portfolio_status_payload(self) -> Tuple[bytes, str]:
+        """Portfolio status serialized once per snapshot (shared by every poller) and its ETag"""
+        snapshot = self._get_status_snapshot()
+        return snapshot[2], snapshot[3]
+    
+    def _get_status_snapshot(self) -> Tuple[float, Dict, bytes, str]:
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached and now - cached[0] < self.status_cache_ttl:
+            return cached
+        
+        # Single flight: concurrent pollers that miss wait for one rebuild instead of each doing it
+        with self._status_lock:
+            cached = self._status_cache
+            if cached and now - cached[0] < self.status_cache_ttl:
+                return cached
+            status = self._build_portfolio_status()
+            payload = orjson.dumps(status)
+            cached = self._status_cache = (now, status, payload, hashlib.md5(payload).hexdigest())
+            return cached
+    
+    def _build_portfolio_status(self) -> Dict:
+        """Build current portfolio status"""
+        # Appends/removals mid-strategy aren't always followed by a save, so also check the count
+        view = self._positions_view
+        if self._positions_dirty or view is None or view[0] != len(self.positions):
+            self._positions_dirty = False
+            view = self._positions_view = (len(self.positions), *self._build_position_rows())
+        _, total_collateral_value, total_loan_value, annual_yield, positions = view
+        
+        net_value = total_collateral_value - total_loan_value
+        leverage_ratio = (total_collateral_value / self.total_capital) if self.total_capital > 0 else 0
+        roi_percentage = (annual_yield / self.total_capital * 100) if self.total_capital > 0 else 0
+        
+        return {
+            'bot_status': self.bot_status,
+            'total_positions': len(self.positions),
+            'total_capital': self.total_capital,
+            'leveraged_capital': total_loan_value,
+            'net_portfolio_value': net_value,
+            'total_yield': roi_percentage,
+            'leverage_ratio': leverage_ratio,
+            'last_update': self._last_status_time_str or _now_str(),
+            'positions': positions
+        }
+    
+    def _build_position_rows(self) -> Tuple[float, float, float, List[Dict]]:
+        """Dashboard rows plus collateral, loan and yield totals for current positions"""
         total_collateral_value = 0
         total_loan_value = 0
+        annual_yield = 0
+        positions = []
         
+        # Single pass: look up each price once and reuse it for totals, yield and the row
         for position in self.positions:
             asset_price = self._get_asset_price(position.asset)
-            total_collateral_value += position.collateral_amount * asset_price
+            position_value = position.collateral_amount * asset_price
+            total_collateral_value += position_value
             
             # Calculate loan value in USD
             if position.loan_asset == 'USDT':
@@ -1530,53 +1961,33 @@ class EarnWalletLeverageBot:
             else:
                 loan_asset_price = self._get_asset_price(position.loan_asset)
                 total_loan_value += position.loan_amount * loan_asset_price
-        
-        net_value = total_collateral_value - total_loan_value
-        leverage_ratio = (total_collateral_value / self.total_capital) if self.total_capital > 0 else 0
-        
-        # Calculate estimated yield
-        annual_yield = 0
-        for position in self.positions:
+            
+            # Calculate estimated yield on position value
             asset_config = self.asset_config.get(position.asset)
             if asset_config:
                 # Use actual loan rate if available
                 loan_rate = position.loan_rate if position.loan_rate > 0 else asset_config.loan_rate
-                net_rate = asset_config.yield_rate - loan_rate
-                
-                # Calculate yield on position value
-                position_value = position.collateral_amount * self._get_asset_price(position.asset)
-                annual_yield += net_rate * position_value
-        
-        roi_percentage = (annual_yield / self.total_capital * 100) if self.total_capital > 0 else 0
+                annual_yield += (asset_config.yield_rate - loan_rate) * position_value
+            
+            positions.append({
+                'level': position.level,
+                'asset': position.asset,
+                'collateral': position.collateral_amount,
+                'loan': position.loan_amount,
+                'loan_asset': position.loan_asset,
+                'ltv': position.current_ltv,
+                # Dashboard colour band (matches the JS thresholds it replaces)
+                'ltv_class': 'ltv-danger' if position.current_ltv > 0.75 else 'ltv-warning' if position.current_ltv > 0.60 else 'ltv-good',
+                'usd_value': position_value,
+                'order_id': position.order_id,
+                'loan_order_id': position.loan_order_id,
+                'loan_rate': f"{position.loan_rate:.2%}" if position.loan_rate > 0 else "N/A",
+                'entry_price': position.entry_price,
+                'current_price': asset_price,
+                'pnl_percent': ((asset_price / position.entry_price - 1) * 100) if position.entry_price > 0 else 0
+            })
         
-        return {
-            'bot_status': self.bot_status,
-            'total_positions': len(self.positions),
-            'total_capital': self.total_capital,
-            'leveraged_capital': total_loan_value,
-            'net_portfolio_value': net_value,
-            'total_yield': roi_percentage,
-            'leverage_ratio': leverage_ratio,
-            'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'positions': [
-                {
-                    'level': pos.level,
-                    'asset': pos.asset,
-                    'collateral': pos.collateral_amount,
-                    'loan': pos.loan_amount,
-                    'loan_asset': pos.loan_asset,
-                    'ltv': pos.current_ltv,
-                    'usd_value': pos.collateral_amount * self._get_asset_price(pos.asset),
-                    'order_id': pos.order_id,
-                    'loan_order_id': pos.loan_order_id,
-                    'loan_rate': f"{pos.loan_rate:.2%}" if pos.loan_rate > 0 else "N/A",
-                    'entry_price': pos.entry_price,
-                    'current_price': self._get_asset_price(pos.asset),
-                    'pnl_percent': ((self._get_asset_price(pos.asset) / pos.entry_price - 1) * 100) if pos.entry_price > 0 else 0
-                }
-                for pos in self.positions
-            ]
-        }
+        return total_collateral_value, total_loan_value, annual_yield, positions
     
     def test_connection(self) -> Dict:
         """Test API connection and permissions"""
@@ -1592,8 +2003,17 @@ class EarnWalletLeverageBot:
         }
         
         try:
+            # The checks are independent requests: issue them together, then evaluate in order
+            api = self.binance_api
+            with ThreadPoolExecutor(max_workers=5, thread_name_prefix="binance-test") as pool:
+                ping_future = pool.submit(api._make_request, "/api/v3/ping", require_auth=False)
+                account_future = pool.submit(api.get_account_info)
+                prices_future = pool.submit(api.get_all_prices)
+                savings_future = pool.submit(api.get_savings_products)
+                loans_future = pool.submit(api.get_loan_data)
+            
             # Test basic connection
-            ping = self.binance_api._make_request("/api/v3/ping", require_auth=False)
+            ping = ping_future.result()
             if not ping.get("error"):
                 results['connection'] = True
                 self.logger.info("✅ API connection successful")
@@ -1602,7 +2022,7 @@ class EarnWalletLeverageBot:
             
             # Test account access
             try:
-                account = self.binance_api.get_account_info()
+                account = account_future.result()
                 if not account.get("error"):
                     results['account'] = True
                     results['permissions'] = account.get('permissions', [])
@@ -1615,7 +2035,7 @@ class EarnWalletLeverageBot:
             
             # Test price data
             try:
-                prices = self.binance_api.get_all_prices()
+                prices = prices_future.result()
                 if prices and len(prices) > 0:
                     results['prices'] = True
                     self.logger.info(f"✅ Price data available: {len(prices)} symbols")
@@ -1626,7 +2046,7 @@ class EarnWalletLeverageBot:
             
             # Test savings products
             try:
-                savings = self.binance_api.get_savings_products()
+                savings = savings_future.result()
                 if savings and len(savings) > 0:
                     results['savings'] = True
                     self.logger.info(f"✅ Savings products available: {len(savings)} products")
@@ -1637,7 +2057,7 @@ class EarnWalletLeverageBot:
             
             # Test loan data
             try:
-                loan_data = self.binance_api.get_loan_data()
+                loan_data = loans_future.result()
                 if loan_data and not loan_data.get("error"):
                     results['loans'] = True
                     self.logger.info("✅ Loan data available")
@@ -1651,6 +2071,24 @@ class EarnWalletLeverageBot:
             results['errors'].append(f"Test error: {str(e)}")
             
         return results
+    
+    def get_cached_account_balances(self) -> Dict:
+        """Account balances, refetched at most once per balances_cache_ttl across all pollers"""
+        cached = self._balances_cache
+        if cached and time.monotonic() - cached[0] < self.balances_cache_ttl:
+            return cached[1]
+        
+        with self._balances_lock:
+            cached = self._balances_cache
+            if cached and time.monotonic() - cached[0] < self.balances_cache_ttl:
+                return cached[1]
+            balances = self.get_account_balances()
+            # Failures aren't cached, so the next poll retries
+            if 'error' not in balances:
+                self._balances_cache = (time.monotonic(), balances)
+            return balances
+    
+    def get_account_balances(self) -> Dict:
         """Get account balances"""
         try:
             account_info = self.binance_api.get_account_info()
@@ -1660,6 +2098,11 @@ class EarnWalletLeverageBot:
             balances = {}
             total_usd = 0
             
+            self._prefetch_prices(
+                b['asset'] for b in account_info.get('balances', [])
+                if float(b['free']) + float(b['locked']) > 0.001
+            )
+            
             # Get spot balances
             for balance in account_info.get('balances', []):
                 asset = balance['asset']
@@ -1686,6 +2129,7 @@ class EarnWalletLeverageBot:
             try:
                 savings_positions = self.binance_api.get_savings_positions()
                 if savings_positions and isinstance(savings_positions, list):
+                    self._prefetch_prices(p.get('asset', '') for p in savings_positions if p.get('asset'))
                     for position in savings_positions:
                         asset = position.get('asset', '')
                         amount = float(position.get('totalAmount', 0))
@@ -1727,7 +2171,7 @@ class EarnWalletLeverageBot:
                 'total_usd_value': total_usd,
                 'balances': balances,
                 'loans': loans,
-                'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'last_update': _now_str()
             }
             
         except Exception as e:
@@ -1735,9 +2179,30 @@ class EarnWalletLeverageBot:
 
 # Global bot instance
 bot = None
+_bot_lock = threading.RLock()
+
+def _get_or_create_bot(api_key: str, api_secret: str, testnet: bool) -> 'EarnWalletLeverageBot':
+    """Return the global bot, constructing it exactly once even when requests race"""
+    global bot
+    # Construction takes seconds (API calls, position resume); without the lock concurrent first
+    # requests each built a bot, and the losers' resumed monitoring kept running unseen
+    with _bot_lock:
+        if bot is None:
+            bot = EarnWalletLeverageBot(api_key, api_secret, testnet)
+        return bot
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Route Flask's JSON (jsonify, request.get_json) through orjson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Flask Application
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
@@ -1755,7 +2220,6 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             text-align: center;
             font-weight: bold;
             box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-            animation: pulse 2s infinite;
         }
         
         @keyframes pulse {
@@ -1886,7 +2350,6 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             height: 10px;
             background: #fff;
             border-radius: 50%;
-            animation: blink 2s infinite;
             margin-right: 10px;
             display: inline-block;
         }
@@ -1896,6 +2359,12 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             50% { opacity: 0.3; }
         }
         
+        /* Endless animations keep the page repainting; only run them for users who haven't asked for less motion */
+        @media (prefers-reduced-motion: no-preference) {
+            .earn-banner { animation: pulse 2s infinite; }
+            .monitoring-indicator { animation: blink 2s infinite; }
+        }
+        
         .loans-section {
             background: #fff3cd;
             border: 1px solid #ffeaa7;
@@ -2097,12 +2566,19 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     </tr>
                 </tbody>
             </table>
+            <template id="position-row-template">
+                <tr><td><strong></strong></td><td><strong></strong></td><td></td><td></td><td><span class="loan-asset"></span></td><td><span class="loan-rate"></span></td><td></td><td></td><td></td><td><small></small></td></tr>
+            </template>
         </div>
     </div>
 
     <script type="text/javascript">
         let isTrading = false;
         
+        // Built once and reused: toLocaleString sets up a new locale formatter on every call
+        const formatUsd = new Intl.NumberFormat(undefined, {minimumFractionDigits: 2});
+        const formatAmount = new Intl.NumberFormat(undefined, {minimumFractionDigits: 4});
+        
         function startEarnLeverage() {
             if (isTrading) return;
             
@@ -2125,7 +2601,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 isTrading = false;
                 if (result.success) {
                     alert('EARN LEVERAGE STARTED! Creating optimized leveraged positions...');
-                    setTimeout(updateStatus, 2000);
+                    resetPolling(2000);
                 } else {
                     alert('Failed: ' + result.error);
                 }
@@ -2142,7 +2618,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     .then(function(response) { return response.json(); })
                     .then(function(result) {
                         alert('Closing all positions...');
-                        setTimeout(updateStatus, 2000);
+                        resetPolling(2000);
                     })
                     .catch(function(error) {
                         alert('Error: ' + error.message);
@@ -2179,11 +2655,42 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 });
         }
         
+        // Adaptive polling: every 3s while the status is changing, doubling up to 60s while it isn't.
+        // A setTimeout chain (not setInterval) so each tick schedules the next one at the current pace.
+        const MIN_POLL_MS = 3000;
+        const MAX_POLL_MS = 60000;
+        let pollMs = MIN_POLL_MS;
+        let pollTimer = null;
+        let lastStatusKey = '';
+        
+        function resetPolling(delay) {
+            pollMs = MIN_POLL_MS;
+            clearTimeout(pollTimer);
+            pollTimer = setTimeout(poll, delay);
+        }
+        
+        async function poll() {
+            if (document.visibilityState !== 'visible') return;  // visibilitychange restarts the chain
+            await updateStatus();
+            clearTimeout(pollTimer);
+            pollTimer = setTimeout(poll, pollMs);
+        }
+        
+        // A newer refresh aborts the one in flight; the sequence number drops any late response regardless
+        let inflight = null;
+        let requestSeq = 0;
+        let appliedSeq = 0;
+        
         async function updateStatus() {
+            if (inflight) inflight.abort();
+            const controller = new AbortController();
+            inflight = controller;
+            const seq = ++requestSeq;
+            
             try {
                 const [statusResponse, balanceResponse] = await Promise.all([
-                    fetch('/status'),
-                    fetch('/balances')
+                    fetch('/status', { signal: controller.signal }),
+                    fetch('/balances', { signal: controller.signal })
                 ]);
                 
                 // Check if responses are ok
@@ -2214,107 +2721,164 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     balanceData = { balances: {}, loans: {} };
                 }
                 
-                // Update metrics
-                document.getElementById('total-capital').textContent = (statusData.total_capital || 0).toLocaleString(undefined, {minimumFractionDigits: 2});
-                document.getElementById('leveraged-capital').textContent = (statusData.leveraged_capital || 0).toLocaleString(undefined, {minimumFractionDigits: 2});
-                document.getElementById('net-value').textContent = (statusData.net_portfolio_value || 0).toLocaleString(undefined, {minimumFractionDigits: 2});
-                document.getElementById('total-yield').textContent = (statusData.total_yield || 0).toFixed(2);
-                document.getElementById('position-count').textContent = statusData.total_positions || 0;
-                
-                // Update bot status
-                const statusElement = document.getElementById('bot-status');
-                statusElement.textContent = statusData.bot_status || 'Unknown';
-                statusElement.className = 'status-indicator status-' + 
-                    (statusData.bot_status || 'unknown').toLowerCase().replace(/[^a-z]/g, '-').replace(/-+/g, '-');
-                
-                // Show/hide monitoring status
-                const monitoringStatus = document.getElementById('monitoring-status');
-                if (statusData.bot_status && (statusData.bot_status.includes('Active') || statusData.bot_status.includes('Resumed'))) {
-                    monitoringStatus.style.display = 'flex';
-                } else {
-                    monitoringStatus.style.display = 'none';
-                }
+                if (seq <= appliedSeq) return;
+                appliedSeq = seq;
                 
-                // Update balances
-                if (balanceData.balances && balanceData.balances['USDT']) {
-                    const usdtBalance = balanceData.balances['USDT'];
-                    document.getElementById('available-usdt').textContent = 
-                        (usdtBalance.spot_free || 0).toLocaleString(undefined, {minimumFractionDigits: 2});
-                } else {
-                    document.getElementById('available-usdt').textContent = '0.00';
-                }
+                const statusKey = statusData.bot_status + '|' + statusData.total_positions + '|' + statusData.last_update;
+                pollMs = statusKey === lastStatusKey ? Math.min(pollMs * 2, MAX_POLL_MS) : MIN_POLL_MS;
+                lastStatusKey = statusKey;
                 
-                document.getElementById('total-loans').textContent = 
-                    (statusData.leveraged_capital || 0).toLocaleString(undefined, {minimumFractionDigits: 2});
-                document.getElementById('net-portfolio').textContent = 
-                    (statusData.net_portfolio_value || 0).toLocaleString(undefined, {minimumFractionDigits: 2});
+                // Write the DOM in one frame, separate from the fetch/parse work
+                requestAnimationFrame(() => applyStatus(statusData, balanceData));
                 
-                // Update loans section
-                if (balanceData.loans && Object.keys(balanceData.loans).length > 0) {
-                    const loansSection = document.getElementById('loans-section');
-                    const loansGrid = document.getElementById('loans-grid');
-                    loansSection.style.display = 'block';
-                    
-                    loansGrid.innerHTML = '';
-                    for (const asset in balanceData.loans) {
-                        const amount = balanceData.loans[asset];
-                        const loanItem = document.createElement('div');
-                        loanItem.className = 'loan-item';
-                        const strong = document.createElement('strong');
-                        strong.textContent = asset;
-                        const br = document.createElement('br');
-                        const text = document.createTextNode(amount.toLocaleString(undefined, {minimumFractionDigits: 4}));
-                        loanItem.appendChild(strong);
-                        loanItem.appendChild(br);
-                        loanItem.appendChild(text);
-                        loansGrid.appendChild(loanItem);
-                    }
-                } else {
-                    document.getElementById('loans-section').style.display = 'none';
+            } catch (error) {
+                if (error.name === 'AbortError') return;  // Superseded by a newer refresh
+                console.error('Error updating status:', error);
+                // Don't throw, just log it
+            } finally {
+                if (inflight === controller) inflight = null;
+            }
+        }
+        
+        // Position table rows by "level:asset"
+        const positionRows = new Map();
+        const positionRowTemplate = document.getElementById('position-row-template');
+        
+        function createPositionRow() {
+            // Clone the pre-parsed row instead of running the HTML parser per row
+            const row = positionRowTemplate.content.firstElementChild.cloneNode(true);
+            // Text goes into each cell's inner element where it has one
+            row._targets = Array.from(row.cells, cell => cell.firstElementChild || cell);
+            row._values = [];
+            return row;
+        }
+        
+        function updatePositionRow(row, pos) {
+            // LTV band comes precomputed from the server
+            const ltvClass = pos.ltv_class;
+            
+            // Determine P&L class
+            const pnlClass = pos.pnl_percent >= 0 ? 'pnl-positive' : 'pnl-negative';
+            
+            const values = [
+                'Level ' + pos.level,
+                pos.asset,
+                pos.collateral.toFixed(6),
+                pos.loan.toFixed(4),
+                pos.loan_asset,
+                pos.loan_rate,
+                (pos.ltv * 100).toFixed(1) + '%',
+                formatUsd.format(pos.usd_value),
+                (pos.pnl_percent >= 0 ? '+' : '') + pos.pnl_percent.toFixed(2) + '%',
+                pos.loan_order_id || 'N/A'
+            ];
+            for (let i = 0; i < values.length; i++) {
+                if (row._values[i] !== values[i]) {
+                    row._targets[i].textContent = values[i];
+                    row._values[i] = values[i];
                 }
-                
-                // Update positions table
-                const tbody = document.getElementById('positions-body');
-                tbody.innerHTML = '';
-                
-                if (!statusData.positions || statusData.positions.length === 0) {
+            }
+            if (row.cells[6].className !== ltvClass) row.cells[6].className = ltvClass;
+            if (row.cells[8].className !== pnlClass) row.cells[8].className = pnlClass;
+        }
+        
+        // Render a status/balances pair into the page (kept apart from fetching so any data source can drive it)
+        function applyStatus(statusData, balanceData) {
+            // Update metrics
+            document.getElementById('total-capital').textContent = formatUsd.format(statusData.total_capital || 0);
+            document.getElementById('leveraged-capital').textContent = formatUsd.format(statusData.leveraged_capital || 0);
+            document.getElementById('net-value').textContent = formatUsd.format(statusData.net_portfolio_value || 0);
+            document.getElementById('total-yield').textContent = (statusData.total_yield || 0).toFixed(2);
+            document.getElementById('position-count').textContent = statusData.total_positions || 0;
+            
+            // Update bot status
+            const statusElement = document.getElementById('bot-status');
+            statusElement.textContent = statusData.bot_status || 'Unknown';
+            statusElement.className = 'status-indicator status-' + 
+                (statusData.bot_status || 'unknown').toLowerCase().replace(/[^a-z]/g, '-').replace(/-+/g, '-');
+            
+            // Show/hide monitoring status
+            const monitoringStatus = document.getElementById('monitoring-status');
+            if (statusData.bot_status && (statusData.bot_status.includes('Active') || statusData.bot_status.includes('Resumed'))) {
+                monitoringStatus.style.display = 'flex';
+            } else {
+                monitoringStatus.style.display = 'none';
+            }
+            
+            // Update balances
+            if (balanceData.balances && balanceData.balances['USDT']) {
+                const usdtBalance = balanceData.balances['USDT'];
+                document.getElementById('available-usdt').textContent = 
+                    formatUsd.format(usdtBalance.spot_free || 0);
+            } else {
+                document.getElementById('available-usdt').textContent = '0.00';
+            }
+            
+            document.getElementById('total-loans').textContent = 
+                formatUsd.format(statusData.leveraged_capital || 0);
+            document.getElementById('net-portfolio').textContent = 
+                formatUsd.format(statusData.net_portfolio_value || 0);
+            
+            // Update loans section
+            if (balanceData.loans && Object.keys(balanceData.loans).length > 0) {
+                const loansSection = document.getElementById('loans-section');
+                const loansGrid = document.getElementById('loans-grid');
+                loansSection.style.display = 'block';
+                
+                loansGrid.innerHTML = '';
+                for (const asset in balanceData.loans) {
+                    const amount = balanceData.loans[asset];
+                    const loanItem = document.createElement('div');
+                    loanItem.className = 'loan-item';
+                    const strong = document.createElement('strong');
+                    strong.textContent = asset;
+                    const br = document.createElement('br');
+                    const text = document.createTextNode(formatAmount.format(amount));
+                    loanItem.appendChild(strong);
+                    loanItem.appendChild(br);
+                    loanItem.appendChild(text);
+                    loansGrid.appendChild(loanItem);
+                }
+            } else {
+                document.getElementById('loans-section').style.display = 'none';
+            }
+            
+            // Update positions table: reuse keyed rows and only touch cells whose values changed
+            const tbody = document.getElementById('positions-body');
+            const positions = statusData.positions || [];
+            
+            if (positions.length === 0) {
+                if (positionRows.size > 0 || !tbody.children.length) {
+                    positionRows.clear();
                     tbody.innerHTML = '<tr><td colspan="10" style="text-align: center; color: #666;">No earn positions</td></tr>';
-                } else {
-                    statusData.positions.forEach(pos => {
-                        const row = document.createElement('tr');
-                        
-                        // Determine LTV class
-                        let ltvClass = 'ltv-good';
-                        if (pos.ltv > 0.75) ltvClass = 'ltv-danger';
-                        else if (pos.ltv > 0.60) ltvClass = 'ltv-warning';
-                        
-                        // Determine P&L class
-                        const pnlClass = pos.pnl_percent >= 0 ? 'pnl-positive' : 'pnl-negative';
-                        
-                        row.innerHTML = `
-                            <td><strong>Level ${pos.level}</strong></td>
-                            <td><strong>${pos.asset}</strong></td>
-                            <td>${pos.collateral.toFixed(6)}</td>
-                            <td>${pos.loan.toFixed(4)}</td>
-                            <td><span class="loan-asset">${pos.loan_asset}</span></td>
-                            <td><span class="loan-rate">${pos.loan_rate}</span></td>
-                            <td class="${ltvClass}">${(pos.ltv * 100).toFixed(1)}%</td>
-                            <td>${pos.usd_value.toLocaleString(undefined, {minimumFractionDigits: 2})}</td>
-                            <td class="${pnlClass}">${pos.pnl_percent >= 0 ? '+' : ''}${pos.pnl_percent.toFixed(2)}%</td>
-                            <td><small>${pos.loan_order_id || 'N/A'}</small></td>
-                        `;
-                        tbody.appendChild(row);
-                    });
                 }
-                
-                // Show error if present
-                if (balanceData.error) {
-                    console.error('Balance error:', balanceData.error);
+            } else {
+                const seen = new Set();
+                positions.forEach((pos, i) => {
+                    const key = pos.level + ':' + pos.asset;
+                    seen.add(key);
+                    let row = positionRows.get(key);
+                    if (!row) {
+                        row = createPositionRow();
+                        positionRows.set(key, row);
+                    }
+                    updatePositionRow(row, pos);
+                    if (tbody.children[i] !== row) {
+                        tbody.insertBefore(row, tbody.children[i] || null);
+                    }
+                });
+                // Everything after the current rows is stale (closed positions or the empty placeholder)
+                while (tbody.children.length > positions.length) {
+                    tbody.lastElementChild.remove();
                 }
-                
-            } catch (error) {
-                console.error('Error updating status:', error);
-                // Don't throw, just log it
+                for (const key of positionRows.keys()) {
+                    if (!seen.has(key)) positionRows.delete(key);
+                }
+            }
+            
+            // Show error if present
+            if (balanceData.error) {
+                console.error('Balance error:', balanceData.error);
             }
         }
         
@@ -2324,20 +2888,44 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         window.updateStatus = updateStatus;
         window.testConnection = testConnection;
         
-        // Auto-refresh every 15 seconds
-        setInterval(updateStatus, 15000);
+        // Auto-refresh while the tab is visible; catch up as soon as it is shown again
+        document.addEventListener('visibilitychange', function() {
+            if (document.visibilityState === 'visible') resetPolling(0);
+        });
         
-        // Initial load after a short delay
-        setTimeout(updateStatus, 1000);
+        // Any interaction suggests something is about to change - poll quickly again
+        document.addEventListener('click', function() {
+            resetPolling(MIN_POLL_MS);
+        });
+        
+        // Initial load straight away, so it picks up the responses preloaded via the Link header
+        resetPolling(0);
     </script>
 </body>
 </html>
-'''
+"""
+
+def _json_response(obj) -> Response:
+    """JSON response encoded with orjson (much faster float formatting than jsonify's stdlib json)"""
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
+def json_endpoint(on_error):
+    """Serialize a view's dict result with orjson; an exception becomes on_error(e), still a 200 the dashboard can render"""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                result = view(*args, **kwargs)
+            except Exception as e:
+                result = on_error(e)
+            return result if isinstance(result, Response) else _json_response(result)
+        return wrapper
+    return decorator
 
 @app.route('/health')
 def health_check():
     """Simple health check endpoint"""
-    return jsonify({
+    return _json_response({
         'status': 'ok',
         'timestamp': datetime.now().isoformat()
     })
@@ -2346,133 +2934,127 @@ def health_check():
 def favicon():
     return '', 204  # No content
 
+# The dashboard has no template variables, so serve fixed bytes instead of rendering through Jinja
+_INDEX_BYTES = HTML_TEMPLATE.encode('utf-8')
+_INDEX_ETAG = hashlib.md5(_INDEX_BYTES).hexdigest()
+# Compressed once at import; mtime=0 keeps the bytes (and so the ETag) identical across restarts
+_INDEX_GZIP = gzip.compress(_INDEX_BYTES, compresslevel=9, mtime=0)
+_INDEX_GZIP_ETAG = _INDEX_ETAG + '-gzip'
+_INDEX_PRELOAD = '</status>; rel=preload; as=fetch; crossorigin, </balances>; rel=preload; as=fetch; crossorigin'
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    if request.accept_encodings['gzip']:
+        response = Response(_INDEX_GZIP, mimetype='text/html')
+        response.content_encoding = 'gzip'
+        response.set_etag(_INDEX_GZIP_ETAG)
+    else:
+        response = Response(_INDEX_BYTES, mimetype='text/html')
+        response.set_etag(_INDEX_ETAG)
+    response.vary.add('Accept-Encoding')
+    # Let the browser start the first status/balances fetches while it is still parsing the page
+    response.headers['Link'] = _INDEX_PRELOAD
+    # Revalidate on every load (cheap 304) so a redeploy is picked up immediately
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+def _idle_status(bot_status: str) -> Dict:
+    """Status payload when there is no bot (or it failed), shaped like get_portfolio_status"""
+    return {
+        'bot_status': bot_status,
+        'total_positions': 0,
+        'total_capital': 0,
+        'leveraged_capital': 0,
+        'net_portfolio_value': 0,
+        'total_yield': 0,
+        'leverage_ratio': 0,
+        'last_update': _now_str(),
+        'positions': []
+    }
 
 @app.route('/start', methods=['POST'])
+@json_endpoint(lambda e: {'success': False, 'error': str(e)})
 def start_trading():
-    global bot
-    try:
-        data = request.get_json()
-        capital = data.get('capital', 50)
-        
-        api_key = os.getenv('BINANCE_API_KEY')
-        api_secret = os.getenv('BINANCE_API_SECRET')
-        testnet = os.getenv('BINANCE_TESTNET', 'false').lower() == 'true'
-        
-        if not api_key or not api_secret:
-            return jsonify({'success': False, 'error': 'API credentials not configured'})
-        
-        # Create new bot instance if needed
-        if not bot:
-            bot = EarnWalletLeverageBot(api_key, api_secret, testnet)
-        
-        # Start earn leverage in background
-        def start_async():
-            try:
-                asyncio.run(bot.start_trading(capital))
-            except Exception as e:
-                bot.logger.error(f"Trading thread error: {e}")
-                bot.bot_status = f"Error: {str(e)}"
-                bot._save_positions()
-        
-        thread = threading.Thread(target=start_async)
-        thread.start()
-        
-        return jsonify({'success': True, 'message': 'Optimized earn leverage executing'})
-        
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+    data = request.get_json()
+    capital = data.get('capital', 50)
+    
+    api_key = os.getenv('BINANCE_API_KEY')
+    api_secret = os.getenv('BINANCE_API_SECRET')
+    testnet = os.getenv('BINANCE_TESTNET', 'false').lower() == 'true'
+    
+    if not api_key or not api_secret:
+        return {'success': False, 'error': 'API credentials not configured'}
+    
+    # Create new bot instance if needed
+    current_bot = _get_or_create_bot(api_key, api_secret, testnet)
+    
+    # Start earn leverage on the background loop; the monitoring task it
+    # creates keeps running there after start_trading returns. Failures are
+    # logged and reflected in bot_status by start_trading itself.
+    _run_coroutine(current_bot.start_trading(capital))
+    
+    return {'success': True, 'message': 'Optimized earn leverage executing'}
 
 @app.route('/stop', methods=['POST'])
+@json_endpoint(lambda e: {'success': False, 'error': str(e)})
 def stop_trading():
-    global bot
-    try:
-        if bot:
-            bot.stop_trading()
-        return jsonify({'success': True, 'message': 'Earn positions closing'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+    current_bot = bot
+    if current_bot:
+        current_bot.stop_trading()
+    return {'success': True, 'message': 'Earn positions closing'}
 
 @app.route('/status')
+@json_endpoint(lambda e: {**_idle_status(f'Error: {str(e)}'), 'error': str(e)})
 def get_status():
-    global bot
-    try:
-        if bot:
-            return jsonify(bot.get_portfolio_status())
-        else:
-            return jsonify({
-                'bot_status': 'Stopped',
-                'total_positions': 0,
-                'total_capital': 0,
-                'leveraged_capital': 0,
-                'net_portfolio_value': 0,
-                'total_yield': 0,
-                'leverage_ratio': 0,
-                'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'positions': []
-            })
-    except Exception as e:
-        return jsonify({
-            'bot_status': f'Error: {str(e)}',
-            'total_positions': 0,
-            'total_capital': 0,
-            'leveraged_capital': 0,
-            'net_portfolio_value': 0,
-            'total_yield': 0,
-            'leverage_ratio': 0,
-            'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'positions': [],
-            'error': str(e)
-        })
+    current_bot = bot
+    if not current_bot:
+        return _idle_status('Stopped')
+    
+    payload, etag = current_bot.get_portfolio_status_payload()
+    response = Response(payload, mimetype='application/json')
+    response.set_etag(etag)
+    # Browsers revalidate each poll; an unchanged status comes back as a bodiless 304
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 @app.route('/balances')
+@json_endpoint(lambda e: {
+    'total_usd_value': 0,
+    'balances': {},
+    'loans': {},
+    'error': f'Balance fetch error: {str(e)}'
+})
 def get_balances():
-    global bot
-    
-    try:
-        if not bot:
-            api_key = os.getenv('BINANCE_API_KEY')
-            api_secret = os.getenv('BINANCE_API_SECRET')
-            testnet = os.getenv('BINANCE_TESTNET', 'false').lower() == 'true'
-            
-            if not api_key or not api_secret:
-                return jsonify({'total_usd_value': 0, 'balances': {}, 'loans': {}, 'error': 'No API credentials'})
-            
-            bot = EarnWalletLeverageBot(api_key, api_secret, testnet)
-        
-        return jsonify(bot.get_account_balances())
-    except Exception as e:
-        return jsonify({
-            'total_usd_value': 0, 
-            'balances': {}, 
-            'loans': {}, 
-            'error': f'Balance fetch error: {str(e)}'
-        })
-
-@app.route('/test')
-def test_connection():
-    global bot
-    
-    try:
+    current_bot = bot
+    if not current_bot:
         api_key = os.getenv('BINANCE_API_KEY')
         api_secret = os.getenv('BINANCE_API_SECRET')
         testnet = os.getenv('BINANCE_TESTNET', 'false').lower() == 'true'
         
         if not api_key or not api_secret:
-            return jsonify({'error': 'No API credentials configured'})
-        
-        # Validate API key format
-        if len(api_key) < 10 or len(api_secret) < 10:
-            return jsonify({'error': 'Invalid API credentials format'})
+            return {'total_usd_value': 0, 'balances': {}, 'loans': {}, 'error': 'No API credentials'}
         
-        if not bot:
-            bot = EarnWalletLeverageBot(api_key, api_secret, testnet)
-        
-        return jsonify(bot.test_connection())
-    except Exception as e:
-        return jsonify({'error': f'Test connection failed: {str(e)}'})
+        current_bot = _get_or_create_bot(api_key, api_secret, testnet)
+    
+    return current_bot.get_cached_account_balances()
+
+@app.route('/test')
+@json_endpoint(lambda e: {'error': f'Test connection failed: {str(e)}'})
+def test_connection():
+    api_key = os.getenv('BINANCE_API_KEY')
+    api_secret = os.getenv('BINANCE_API_SECRET')
+    testnet = os.getenv('BINANCE_TESTNET', 'false').lower() == 'true'
+    
+    if not api_key or not api_secret:
+        return {'error': 'No API credentials configured'}
+    
+    # Validate API key format
+    if len(api_key) < 10 or len(api_secret) < 10:
+        return {'error': 'Invalid API credentials format'}
+    
+    current_bot = _get_or_create_bot(api_key, api_secret, testnet)
+    
+    return current_bot.test_connection()
 
 if __name__ == '__main__':
     # Initialize bot on startup if credentials exist
@@ -2482,13 +3064,12 @@ if __name__ == '__main__':
         testnet = os.getenv('BINANCE_TESTNET', 'false').lower() == 'true'
         
         if api_key and api_secret:
-            bot = EarnWalletLeverageBot(api_key, api_secret, testnet)
+            _get_or_create_bot(api_key, api_secret, testnet)
             print("✅ Bot initialized successfully")
         else:
             print("⚠️ No API credentials configured - bot will be initialized on first request")
     except Exception as e:
         print(f"❌ Error initializing bot: {e}")
-        bot = None
     
     port = int(os.environ.get('PORT', 8080))
     print(f"🚀 Starting Earn Wallet Leverage Bot on port {port}")
@@ -0,0 +1,22 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Dummy credentials: neither route below creates a bot, so nothing reaches Binance
+os.environ.setdefault('BINANCE_API_KEY', 'test-key')
+os.environ.setdefault('BINANCE_API_SECRET', 'test-secret')
+
+import main
+
+
+def test_index_renders():
+    response = main.app.test_client().get('/')
+    assert response.status_code == 200
+    assert b'<!DOCTYPE html>' in response.data
+
+
+def test_status_without_bot():
+    response = main.app.test_client().get('/status')
+    assert response.status_code == 200
+    assert response.get_json()['bot_status'] == 'Stopped'